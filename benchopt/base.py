@@ -272,14 +272,22 @@ class CommandLineSolver(BaseSolver, ABC):
     The goal of this base class is to provide easy to use temporary files and
     solvers that derive from this class should dump their data in
     `self.data_filename` and the result in `self.model_filename`.
+
+    The temporary files are created lazily, on first access, so solvers that
+    keep everything in memory do not pay the file creation cost.
     """
 
-    def __init__(self, **parameters):
-        self._data_file = tempfile.NamedTemporaryFile()
-        self._model_file = tempfile.NamedTemporaryFile()
-        self.data_filename = self._data_file.name
-        self.model_filename = self._model_file.name
-        super().__init__(**parameters)
+    @property
+    def data_filename(self):
+        if not hasattr(self, '_data_file'):
+            self._data_file = tempfile.NamedTemporaryFile()
+        return self._data_file.name
+
+    @property
+    def model_filename(self):
+        if not hasattr(self, '_model_file'):
+            self._model_file = tempfile.NamedTemporaryFile()
+        return self._model_file.name
 
 
 class BaseDataset(ParametrizedNameMixin, DependenciesMixin, ABC):
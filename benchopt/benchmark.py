@@ -1,6 +1,7 @@
 import re
 import click
 import warnings
+import functools
 from pathlib import Path
 
 from .config import get_setting
@@ -9,6 +10,7 @@ from .base import BaseSolver, BaseDataset
 from .utils.safe_import import set_benchmark_module
 from .utils.dynamic_modules import _load_class_from_module
 from .utils.dependencies_mixin import DependenciesMixin
+from .utils.dependencies_mixin import _clear_install_check_cache
 from .utils.parametrized_name_mixin import product_param
 from .utils.parametrized_name_mixin import ParametrizedNameMixin
 from .utils.parametrized_name_mixin import _list_all_parametrized_names
@@ -26,6 +28,16 @@ from .config import RAISE_INSTALL_ERROR
 CACHE_DIR = '__cache__'
 SLURM_JOB_NAME = 'benchopt_run'
 
+# Precompiled regexes for the name parsing helpers, which are called for each
+# (name, pattern) pair when filtering the classes to run in a benchmark.
+_OPTIONS_RE = re.compile(r"\[.*\]")
+_QUOTED_NAME_SINGLE_RE = re.compile(r"'[^'\"]*'")
+_QUOTED_NAME_DOUBLE_RE = re.compile(r'"[^\'"]*"')
+_FLOAT_LITERAL_RE = re.compile(
+    r"(?<![a-zA-Z0-9_])[+-]?[0-9]+[.]?[0-9]*[eE][-+]?[0-9]+"
+)
+_VARIABLE_NAME_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9._-]*")
+
 
 MISSING_DEPS_MSG = (
     "This is probably due to missing dependency specification. The "
@@ -490,6 +502,10 @@ class Benchmark:
             hooks(env_name=env_name)
         print(' done')
 
+        # The env content changed: drop the install checks cached while
+        # collecting the requirements, so the verification below re-runs them.
+        _clear_install_check_cache(env_name)
+
         # Check install for all classes that needed extra requirements
         print('- Checking installed packages...', end='', flush=True)
         success = True
@@ -612,6 +628,19 @@ def _check_name_lists(*name_lists):
     return res
 
 
+@functools.lru_cache(maxsize=None)
+def _get_basename(name):
+    "Cached parsing of a name into its basename, without the options."
+    return _extract_options(name)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern):
+    "Cached compilation of an include pattern into a regex."
+    pattern = _get_basename(pattern).replace("*", ".*")
+    return re.compile(f"^{pattern}$", flags=re.IGNORECASE)
+
+
 def is_matched(name, include_patterns=None, default=True):
     """Check if a certain name is matched by any pattern in include_patterns.
 
@@ -619,14 +648,9 @@ def is_matched(name, include_patterns=None, default=True):
     """
     if include_patterns is None or len(include_patterns) == 0:
         return default
-    name = str(name)
-    name = _extract_options(name)[0]
-    substitutions = {"*": ".*"}
+    name = _get_basename(str(name))
     for p in include_patterns:
-        p = _extract_options(p)[0]
-        for old, new in substitutions.items():
-            p = p.replace(old, new)
-        if re.match(f"^{p}$", name, flags=re.IGNORECASE) is not None:
+        if _compile_pattern(p).match(name) is not None:
             return True
     return False
 
@@ -657,8 +681,8 @@ def _extract_options(name):
     if name.count("[") != name.count("]"):
         raise ValueError(f"Invalid name (missing bracket): {name}")
 
-    basename = "".join(re.split(r"\[.*\]", name))
-    matches = re.findall(r"\[.*\]", name)
+    basename = "".join(_OPTIONS_RE.split(name))
+    matches = _OPTIONS_RE.findall(name)
 
     if len(matches) == 0:
         return basename, [], {}
@@ -700,17 +724,16 @@ def _extract_parameters(string):
 
     # First, replace some expressions with their hashes, to avoid modification:
     # - quoted names
-    all_matches = re.findall(r"'[^'\"]*'", string)
-    all_matches += re.findall(r'"[^\'"]*"', string)
+    all_matches = _QUOTED_NAME_SINGLE_RE.findall(string)
+    all_matches += _QUOTED_NAME_DOUBLE_RE.findall(string)
     # - numbers of the form "1e-3" (but not names like "foo1e3")
-    all_matches += re.findall(
-        r"(?<![a-zA-Z0-9_])[+-]?[0-9]+[.]?[0-9]*[eE][-+]?[0-9]+", string)
+    all_matches += _FLOAT_LITERAL_RE.findall(string)
     for match in all_matches:
         string = string.replace(match, str(hash(match)))
 
     # Second, add quotes to all variable names (foo -> 'foo').
     # Accepts dots and dashes within names.
-    string = re.sub(r"[a-zA-Z][a-zA-Z0-9._-]*", r"'\g<0>'", string)
+    string = _VARIABLE_NAME_RE.sub(r"'\g<0>'", string)
 
     # Third, change back the hashes to their original names.
     for match in all_matches:
@@ -14,7 +14,7 @@ class _Callback:
         The solver that is currently run. This allows to retrieve the results
         with :method:`benchopt.base.Solver.get_result` in the callback.
     meta : dict
-        Metadata passed to store in Cost results.
+        Metadata stored alongside each point of the result curve.
         Contains objective and data names, problem dimension, etc.
     stopping_criterion : instance of StoppingCriterion
         Object to check if we need to stop a solver.
@@ -26,7 +26,7 @@ class _Callback:
     stopping_criterion : StoppingCriterion
         Object to check if we need to stop a solver.
     meta : dict
-        Metadata passed to store in Cost results.
+        Metadata stored alongside each point of the result curve.
         Contains objective and data names, problem dimension, etc.
     info : dict
         A dictionary with info from the current system.
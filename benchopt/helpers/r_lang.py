@@ -1,4 +1,6 @@
 import os
+import shutil
+from pathlib import Path
 
 # Make sure that R_HOME is loaded from the current interpreter to avoid
 # using the parent interpreter R_HOME in the sub-interpreter.
@@ -23,8 +25,44 @@ except ImportError:
 # Hide the R warnings
 rpy2.robjects.r['options'](warn=-1)
 
+
+def _get_r_home():
+    """Return the R RHOME output, cached across interpreter invocations.
+
+    ``R RHOME`` spawns a subprocess each time this module is imported, which
+    happens in every worker process of a parallel run. Cache the result in a
+    file in the user cache directory, keyed on the R executable, and
+    recompute it when the R install changes. The cache is kept out of the
+    shared temp directory so other users cannot tamper with the value loaded
+    in ``R_HOME``.
+    """
+    r_bin = shutil.which('R')
+    cache_file = Path.home() / '.cache' / 'benchopt' / 'r_home'
+    if r_bin is not None:
+        try:
+            cached_bin, cached_mtime, r_home = (
+                cache_file.read_text().splitlines()
+            )
+            if (cached_bin == r_bin and os.path.isdir(r_home)
+                    and float(cached_mtime) == os.path.getmtime(r_bin)):
+                return r_home
+        except (OSError, ValueError):
+            pass
+
+    r_home = rpy2.situation.r_home_from_subprocess()
+    if r_bin is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                f"{r_bin}\n{os.path.getmtime(r_bin)}\n{r_home}"
+            )
+        except OSError:
+            pass
+    return r_home
+
+
 # Set the R_HOME directory to the one of the R RHOME ouput
-os.environ['R_HOME'] = rpy2.situation.r_home_from_subprocess()
+os.environ['R_HOME'] = _get_r_home()
 
 
 def import_rpackages(*packages):
@@ -1,3 +1,4 @@
+import shlex
 
 from benchopt.utils.shell_cmd import _run_shell_in_conda_env
 
@@ -31,7 +32,9 @@ def import_shell_cmd(cmd_name, env_name=None):
     )
 
     def run_shell_cmd(*args):
-        cmd_args = " ".join(args)
+        # Quote the arguments so paths with spaces or special characters are
+        # passed to the command as single arguments.
+        cmd_args = " ".join(shlex.quote(str(arg)) for arg in args)
         _run_shell_in_conda_env(
             f"{cmd_name} {cmd_args}", env_name=env_name, raise_on_error=True
         )
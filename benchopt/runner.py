@@ -27,7 +27,7 @@ def run_one_resolution(objective, solver, meta, stop_val):
     solver : instance of BaseSolver
         The solver to use.
     meta : dict
-        Metadata passed to store in Cost results.
+        Metadata stored alongside each point of the result curve.
         Contains objective, data, dimension, id_rep.
     stop_val : int | float
         Corresponds to stopping criterion, such as
@@ -72,7 +72,7 @@ def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
     solver : instance of BaseSolver
         The solver to use.
     meta : dict
-        Metadata passed to store in Cost results.
+        Metadata stored alongside each point of the result curve.
         Contains objective, data, dimension.
     stopping_criterion : StoppingCriterion
         Object to check if we need to stop a solver.
@@ -84,8 +84,8 @@ def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
 
     Returns
     -------
-    curve : list of Cost
-        The cost obtained for all repetitions.
+    curve : list of dict
+        The objective values obtained for all repetitions.
     status : 'done' | 'diverged' | 'timeout' | 'max_runs'
         The status on which the solver was stopped.
     """
@@ -152,8 +152,10 @@ class StoppingCriterion():
             stopping_criterion.get_next_stop_val = solver.get_next
 
         # Store running arguments
+        # Use a monotonic clock for the deadline, so the timeout is not
+        # affected by system clock adjustments (e.g. NTP) during a run.
         if timeout is not None:
-            stopping_criterion._deadline = time.time() + timeout
+            stopping_criterion._deadline = time.perf_counter() + timeout
         else:
             stopping_criterion._deadline = None
         stopping_criterion._prev_objective = 1e100
@@ -222,7 +224,8 @@ class StoppingCriterion():
         if math.isnan(objective) or delta_objective < -1e5:
             stop = True
             status = 'diverged'
-        elif self._deadline is not None and time.time() > self._deadline:
+        elif (self._deadline is not None
+                and time.perf_counter() > self._deadline):
             stop = True
             status = 'timeout'
 
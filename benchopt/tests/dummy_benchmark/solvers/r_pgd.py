@@ -10,11 +10,13 @@ with safe_import_context() as import_ctx:
 
     # Import helpers from rpy2 and benchopt.helpers.r_lang
     from rpy2 import robjects
-    from rpy2.robjects import numpy2ri
+    from rpy2.robjects import numpy2ri, default_converter
     from benchopt.helpers.r_lang import import_func_from_r_file
 
-    # Setup the system to allow passing numpy arrays to rpy2
-    numpy2ri.activate()
+    # Converter to pass numpy arrays to rpy2. It is used explicitly for the
+    # conversions in `set_objective`, rather than activated globally, to
+    # avoid changing the conversion rules for every rpy2 call in the process.
+    np_converter = default_converter + numpy2ri.converter
 
     # Import R function defined in r_pgd.R so they can be retrieved as python
     # functions using `func = robjects.r['FUNC_NAME']`
@@ -38,8 +40,14 @@ class Solver(BaseSolver):
         self.X, self.y, self.lmbd = X, y, lmbd
         self.r_pgd = robjects.r['proximal_gradient_descent']
 
+        # Convert the problem data to R objects once, so the repeated
+        # calls to `run` with increasing `n_iter` do not pay the
+        # Python -> R marshaling cost for each sampled point.
+        self.X_r = np_converter.py2rpy(X)
+        self.y_r = np_converter.py2rpy(y[:, None])
+
     def run(self, n_iter):
-        coefs = self.r_pgd(self.X, self.y[:, None], self.lmbd, n_iter=n_iter)
+        coefs = self.r_pgd(self.X_r, self.y_r, self.lmbd, n_iter=n_iter)
         self.w = np.asarray(coefs)
 
     def get_result(self):
@@ -1,3 +1,4 @@
+import shlex
 import traceback
 
 from ..config import RAISE_INSTALL_ERROR
@@ -10,6 +11,29 @@ from .conda_env_cmd import shell_install_in_conda_env
 from .terminal_output import colorify, YELLOW
 
 
+# Cache for the subprocess-based install checks in conda envs. Each check
+# spawns a `benchopt check-install` process (~100ms), and the same class is
+# checked several times per command, e.g. once per solver/dataset pairing.
+_install_check_cache = {}
+
+
+def _install_check_key(cls, env_name):
+    "Key to cache the install check of a class in a given env."
+    return (str(cls._module_filename), cls._base_class_name, env_name)
+
+
+def _clear_install_check_cache(env_name=None):
+    """Drop all cached install checks for a given env.
+
+    This must be called whenever packages are installed in the env without
+    going through ``DependenciesMixin.install``, e.g. for the bulk install in
+    ``Benchmark.install_all_requirements``, so the checks are run again.
+    """
+    for key in list(_install_check_cache):
+        if key[2] == env_name:
+            del _install_check_cache[key]
+
+
 class DependenciesMixin:
     # Information on how to install the class. The value of install_cmd should
     # be in {'conda', 'shell'}. The API reads:
@@ -69,11 +93,19 @@ class DependenciesMixin:
             else:
                 return True
         else:
-            return _run_shell_in_conda_env(
-                f"benchopt check-install {cls._benchmark_dir} "
-                f"{cls._module_filename} {cls._base_class_name}",
-                env_name=env_name, raise_on_error=raise_on_not_installed
-            ) == 0
+            # Cache the check to avoid spawning the same subprocess again.
+            # Bypass the cache when asked to raise, as a cached failure would
+            # otherwise silence the error.
+            key = _install_check_key(cls, env_name)
+            if key not in _install_check_cache or raise_on_not_installed:
+                _install_check_cache[key] = _run_shell_in_conda_env(
+                    "benchopt check-install "
+                    f"{shlex.quote(str(cls._benchmark_dir))} "
+                    f"{shlex.quote(str(cls._module_filename))} "
+                    f"{cls._base_class_name}",
+                    env_name=env_name, raise_on_error=raise_on_not_installed
+                ) == 0
+            return _install_check_cache[key]
 
     @classmethod
     def install(cls, env_name=None, force=False):
@@ -133,6 +165,8 @@ class DependenciesMixin:
                 if RAISE_INSTALL_ERROR:
                     raise exception
 
+            # The env changed, so drop the cached check before re-checking.
+            _install_check_cache.pop(_install_check_key(cls, env_name), None)
             is_installed = cls.is_installed(env_name=env_name)
             if is_installed:
                 print(" done")
@@ -19,11 +19,6 @@ class ParametrizedNameMixin():
         _parameters = next(product_param(self.parameters))
         _parameters.update(parameters)
         self._parameters = _parameters
-        if not hasattr(self, 'parameter_template'):
-            # sort parameters to make sure the representation is deterministic
-            self.parameter_template = ",".join([
-                f"{k}={_parameters[k]}" for k in sorted(_parameters)
-            ])
         for k, v in _parameters.items():
             if not hasattr(self, k):
                 setattr(self, k, v)
@@ -62,9 +57,25 @@ class ParametrizedNameMixin():
 
     def __repr__(self):
         """Compute the parametrized name of the instance."""
-        out = f"{self.name}"
-        if len(self._parameters) > 0:
-            out += f"[{self.parameter_template}]".format(**self._parameters)
+        # The parameters are not modified once saved, so the name is only
+        # formatted on the first call and cached for the following ones.
+        out = self.__dict__.get('_parametrized_name')
+        if out is None:
+            out = f"{self.name}"
+            if len(self._parameters) > 0:
+                if hasattr(self, 'parameter_template'):
+                    params = self.parameter_template.format(
+                        **self._parameters
+                    )
+                else:
+                    # sort parameters to make sure the representation is
+                    # deterministic
+                    params = ",".join(
+                        f"{k}={self._parameters[k]}"
+                        for k in sorted(self._parameters)
+                    )
+                out += f"[{params}]"
+            self.__dict__['_parametrized_name'] = out
         return out
 
     @classmethod
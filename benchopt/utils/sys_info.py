@@ -35,15 +35,21 @@ def get_cuda_version():
         return None
     command = ["nvidia-smi", "-q", "-x"]
     try:
-        out = subprocess.check_output(command).strip().decode("utf-8")
+        out = subprocess.check_output(command)
     except subprocess.CalledProcessError:
         warnings.warn(
             "`nvidia-smi` has failed. Please check NVIDIA driver install."
         )
         return None
     try:
-        version = re.search('<cuda_version>(.*)</cuda_version>', out).group(1)
-        name = re.search('<product_name>(.*)</product_name>', out).group(1)
+        # Search the raw bytes and only decode the matched fields, to avoid
+        # decoding the full XML output which can be large on multi-GPU nodes.
+        version = re.search(
+            b'<cuda_version>(.*)</cuda_version>', out
+        ).group(1).decode("utf-8")
+        name = re.search(
+            b'<product_name>(.*)</product_name>', out
+        ).group(1).decode("utf-8")
         return f"{name}: cuda_{version}"
     except AttributeError:
         warnings.warn(
@@ -87,9 +93,21 @@ def _get_git_tag():
     return tag
 
 
+# Cache for the system info, which is static for a given process. This avoids
+# spawning subprocesses (`nvidia-smi`, `git describe`) and parsing system files
+# for each timed run of a solver.
+_SYS_INFO_CACHE = None
+
+
 def get_sys_info():
     "Return a dictionary with info from the current system."
 
+    # The system info does not change during the life of the process, so only
+    # collect it once and return a copy afterwards.
+    global _SYS_INFO_CACHE
+    if _SYS_INFO_CACHE is not None:
+        return dict(_SYS_INFO_CACHE)
+
     # Import are nested to avoid long import time when func is not called
     import scipy
     import psutil
@@ -122,4 +140,5 @@ def get_sys_info():
     # Info on benchmark version
     info["benchmark-git-tag"] = _get_git_tag()
 
-    return info
+    _SYS_INFO_CACHE = info
+    return dict(_SYS_INFO_CACHE)
@@ -0,0 +1,37 @@
+import benchopt.utils.dependencies_mixin as dm
+
+
+class FakeSolver(dm.DependenciesMixin):
+    _module_filename = 'fake_module.py'
+    _base_class_name = 'Solver'
+    _benchmark_dir = '.'
+
+
+def test_install_check_cache_invalidation(monkeypatch):
+    # Checks run in a conda env are cached, and the cache is dropped by
+    # _clear_install_check_cache after the env content changed, e.g. for the
+    # bulk install in Benchmark.install_all_requirements.
+    dm._install_check_cache.clear()
+    calls = []
+
+    def fake_run_shell(script, env_name=None, raise_on_error=None):
+        calls.append(script)
+        # Report not installed on the first check, installed afterwards, as
+        # if the requirements were installed in between.
+        return 1 if len(calls) == 1 else 0
+
+    monkeypatch.setattr(dm, '_run_shell_in_conda_env', fake_run_shell)
+
+    assert not FakeSolver.is_installed(env_name='test_env')
+
+    # Repeated checks reuse the cached result without spawning a subprocess.
+    assert not FakeSolver.is_installed(env_name='test_env')
+    assert len(calls) == 1
+
+    # Once the cache is cleared for the env, the check is run again and sees
+    # the freshly installed requirements.
+    dm._clear_install_check_cache('test_env')
+    assert FakeSolver.is_installed(env_name='test_env')
+    assert len(calls) == 2
+
+    dm._install_check_cache.clear()